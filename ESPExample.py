@@ -18,15 +18,22 @@ To run this example:
 2. Or modify the API_KEY constants below
 3. Update email addresses and domain names with your verified values
 4. Run: python ESPExample.py
+   (or python ESPExample.py --parallel to run independent steps concurrently,
+   or python ESPExample.py --lists to only list existing resources)
 """
 
+import asyncio
+import copy
+import logging
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime, timedelta
-from typing import Optional, List
-
-# Add the parent directory to the path to import the SDK
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sendpost-python-sdk'))
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Optional, List, Tuple
 
 import sendpost_python_sdk
 from sendpost_python_sdk import Configuration, ApiClient
@@ -41,6 +48,138 @@ from sendpost_python_sdk.models import (
 )
 from sendpost_python_sdk.exceptions import ApiException
 
+# Workflow output goes through this logger; main() sends it to stdout, while
+# code importing this module stays silent unless it configures logging
+logger = logging.getLogger("esp_example")
+logger.addHandler(logging.NullHandler())
+
+
+class _StepOutput(logging.Filter):
+    """Hold back the log records of a step running concurrently with others
+    
+    run() calls the step and then emits everything it logged as one block, so
+    the output of concurrent steps doesn't interleave line by line.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+        self._flush_lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+    
+    def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Call fn, buffering its log records until it returns"""
+        self._local.records = []
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            records, self._local.records = self._local.records, None
+            with self._flush_lock:
+                for record in records:
+                    logger.handle(record)
+
+
+_step_output = _StepOutput()
+logger.addFilter(_step_output)
+
+
+# Email content, shared by every message built from it
+_TRANSACTIONAL_SUBJECT = "Order Confirmation - Transactional Email"
+_TRANSACTIONAL_HTML = "<h1>Thank you for your order!</h1><p>Your order has been confirmed and will be processed shortly.</p>"
+_TRANSACTIONAL_TEXT = "Thank you for your order! Your order has been confirmed and will be processed shortly."
+_TRANSACTIONAL_HEADERS = {
+    "X-Order-ID": "12345",
+    "X-Email-Type": "transactional"
+}
+_TRANSACTIONAL_CUSTOM_FIELDS = {
+    "customer_id": "67890",
+    "order_value": "99.99"
+}
+
+_MARKETING_SUBJECT = "Special Offer - 20% Off Everything!"
+_MARKETING_HTML = (
+    "<html><body>"
+    "<h1>Special Offer!</h1>"
+    "<p>Get 20% off on all products. Use code: <strong>SAVE20</strong></p>"
+    "<p><a href=\"https://example.com/shop\">Shop Now</a></p>"
+    "</body></html>"
+)
+_MARKETING_TEXT = "Special Offer! Get 20% off on all products. Use code: SAVE20. Visit: https://example.com/shop"
+_MARKETING_HEADERS = {
+    "X-Email-Type": "marketing",
+    "X-Campaign-ID": "campaign-001"
+}
+_MARKETING_GROUPS = ("marketing", "promotional")
+
+
+# Workflow banners, each logged in one call
+_BANNER_START = (
+    "╔═══════════════════════════════════════════════════════════════╗\n"
+    "║   SendPost Python SDK - ESP Example Workflow                  ║\n"
+    "╚═══════════════════════════════════════════════════════════════╝"
+)
+_BANNER_PARALLEL_START = (
+    "╔═══════════════════════════════════════════════════════════════╗\n"
+    "║   SendPost Python SDK - ESP Example Workflow (parallel)       ║\n"
+    "╚═══════════════════════════════════════════════════════════════╝"
+)
+_BANNER_END = (
+    "\n╔═══════════════════════════════════════════════════════════════╗\n"
+    "║   Workflow Complete!                                          ║\n"
+    "╚═══════════════════════════════════════════════════════════════╝"
+)
+
+
+def step(requires: Tuple[str, ...] = (), produces: Optional[str] = None):
+    """Declare a workflow step's inputs and output for ESPExample.run_all()
+    
+    Each artifact named in requires is passed to the step as a keyword argument
+    of the same name; the step's return value is published as produces.
+    """
+    def decorate(method):
+        method.requires = requires
+        method.produces = produces
+        return method
+    return decorate
+
+
+class EmailBatch:
+    """Messages accumulated with add() and sent together by execute()
+    
+    The send endpoint takes one message per request, so execute() issues the
+    requests concurrently rather than as a single POST.
+    """
+    
+    MAX_SIZE = 10
+    
+    def __init__(self, send: Callable[[EmailMessageObject], Any]):
+        self._send = send
+        self._messages: List[EmailMessageObject] = []
+    
+    def __len__(self) -> int:
+        return len(self._messages)
+    
+    def add(self, email_message: EmailMessageObject) -> "EmailBatch":
+        """Queue email_message for the next execute()"""
+        if len(self._messages) >= self.MAX_SIZE:
+            raise ValueError(f"A batch holds at most {self.MAX_SIZE} messages")
+        self._messages.append(email_message)
+        return self
+    
+    def execute(self) -> List[Any]:
+        """Send every queued message and return their responses, in order"""
+        messages, self._messages = self._messages, []
+        if not messages:
+            return []
+        with ThreadPoolExecutor(max_workers=len(messages)) as executor:
+            return list(executor.map(self._send, messages))
+
 
 class ESPExample:
     """SendPost Python SDK Example for Email Service Providers"""
@@ -58,8 +197,100 @@ class ESPExample:
     TEST_DOMAIN_NAME = "yourdomain.com"
     WEBHOOK_URL = "https://your-webhook-endpoint.com/webhook"
     
+    # Webhook settings - which events to receive
+    _WEBHOOK_DEFAULTS = {
+        "url": WEBHOOK_URL,
+        "enabled": True,
+        "processed": True,      # Email processed
+        "delivered": True,      # Email delivered
+        "dropped": True,        # Email dropped
+        "soft_bounced": True,   # Soft bounce
+        "hard_bounced": True,   # Hard bounce
+        "opened": True,         # Email opened
+        "clicked": True,        # Link clicked
+        "unsubscribed": True,   # Unsubscribed
+        "spam": True,           # Marked as spam
+    }
+    
+    # Steps run by run_all(); each starts as soon as the artifacts it requires
+    # (see the @step declarations) have been produced
+    WORKFLOW_STEPS = (
+        "list_sub_accounts",
+        "create_webhook",
+        "list_webhooks",
+        "add_domain",
+        "list_domains",
+        "list_ips",
+        "create_ip_pool",
+        "list_ip_pools",
+        "send_emails_batch",
+        "get_message_details",
+        "get_sub_account_stats",
+        "get_aggregate_stats",
+        "get_account_stats",
+    )
+    
+    # Statistics window length
+    _SEVEN_DAYS = timedelta(days=7)
+    
+    # Message fields and their labels, shown before and after sender/recipient
+    _MESSAGE_FIELDS = (
+        ("message_id", "Message ID"),
+        ("account_id", "Account ID"),
+        ("sub_account_id", "Sub-Account ID"),
+        ("ip_id", "IP ID"),
+        ("public_ip", "Public IP"),
+        ("local_ip", "Local IP"),
+        ("email_type", "Email Type"),
+        ("submitted_at", "Submitted At"),
+    )
+    _MESSAGE_DELIVERY_FIELDS = (
+        ("subject", "Subject"),
+        ("ip_pool", "IP Pool"),
+        ("attempt", "Delivery Attempts"),
+    )
+    
+    # Sub-account stat fields and their report labels
+    _STAT_FIELDS = (
+        ("processed", "Processed"),
+        ("delivered", "Delivered"),
+        ("dropped", "Dropped"),
+        ("hard_bounced", "Hard Bounced"),
+        ("soft_bounced", "Soft Bounced"),
+        ("unsubscribed", "Unsubscribed"),
+        ("spam", "Spam"),
+    )
+    
+    # Freshness windows (seconds) for cached read-only responses
+    _CACHE_TTLS = {
+        "short": 10.0,   # stats
+        "normal": 30.0,  # listings
+    }
+    
+    # Records requested per page when listing IP pools
+    _IP_POOL_PAGE_SIZE = 100
+    
+    # Account-level stat fields and their report labels
+    _ACCOUNT_STAT_FIELDS = (
+        ("processed", "Processed"),
+        ("delivered", "Delivered"),
+        ("dropped", "Dropped"),
+        ("hard_bounced", "Hard Bounced"),
+        ("soft_bounced", "Soft Bounced"),
+        ("opened", "Opens"),
+        ("clicked", "Clicks"),
+        ("unsubscribed", "Unsubscribed"),
+        ("spams", "Spams"),
+    )
+    
     def __init__(self):
         """Initialize the ESP example"""
+        # Start of this run: the stats window ends on its date, and its epoch
+        # seconds make the names of resources created in this run unique
+        self._run_epoch = time.time_ns() // 1_000_000_000
+        today = date.today()
+        self._stats_window = (today - self._SEVEN_DAYS, today)
+        
         self.created_sub_account_id: Optional[int] = None
         self.created_sub_account_api_key: Optional[str] = None
         self.created_webhook_id: Optional[int] = None
@@ -67,809 +298,988 @@ class ESPExample:
         self.created_ip_pool_id: Optional[int] = None
         self.created_ip_pool_name: Optional[str] = None
         self.sent_message_id: Optional[str] = None
+        
+        # Configurations for both auth schemes, built on first use and shared by all clients
+        self._sub_config: Optional[Configuration] = None
+        self._acct_config: Optional[Configuration] = None
+        self._config_lock = threading.Lock()
+        
+        # Long-lived API clients, one per auth scheme and thread, so the underlying
+        # connection pool (and its keep-alive connections) is reused by every step
+        self._local = threading.local()
+        self._clients: List[ApiClient] = []
+        self._clients_lock = threading.Lock()
+        
+        # Read-only responses fetched earlier in the run, reused by later steps
+        # while fresh: (name, *args) -> {generated_at, stale_at, payload}
+        self._cache: Dict[Tuple, Dict[str, Any]] = {}
+        
+        # Validators returned with conditionally fetched responses, sent back
+        # to revalidate them: (name, *args) -> {etag, last_modified, payload}
+        self._etags: Dict[Tuple, Dict[str, Any]] = {}
+        
+        # Base email messages (sender and tracking) per sender name
+        self._message_prototypes: Dict[str, EmailMessageObject] = {}
     
     def _get_sub_account_config(self) -> Configuration:
         """Configure sub-account authentication"""
-        config = Configuration(host=self.BASE_PATH)
-        config.api_key['subAccountAuth'] = self.SUB_ACCOUNT_API_KEY
-        return config
+        if self._sub_config is None:
+            with self._config_lock:
+                if self._sub_config is None:
+                    config = Configuration(host=self.BASE_PATH)
+                    config.api_key['subAccountAuth'] = self.SUB_ACCOUNT_API_KEY
+                    self._sub_config = config
+        return self._sub_config
     
     def _get_account_config(self) -> Configuration:
         """Configure account authentication"""
-        config = Configuration(host=self.BASE_PATH)
-        config.api_key['accountAuth'] = self.ACCOUNT_API_KEY
-        return config
+        if self._acct_config is None:
+            with self._config_lock:
+                if self._acct_config is None:
+                    config = Configuration(host=self.BASE_PATH)
+                    config.api_key['accountAuth'] = self.ACCOUNT_API_KEY
+                    self._acct_config = config
+        return self._acct_config
+    
+    def _new_api_client(self, config: Configuration) -> ApiClient:
+        """Create an API client and register it for close()"""
+        client = ApiClient(config)
+        with self._clients_lock:
+            self._clients.append(client)
+        return client
+    
+    def _sub_api_client(self) -> ApiClient:
+        """Return this thread's API client for sub-account authentication"""
+        client = getattr(self._local, "sub_client", None)
+        if client is None:
+            client = self._local.sub_client = self._new_api_client(self._get_sub_account_config())
+        return client
+    
+    def _acct_api_client(self) -> ApiClient:
+        """Return this thread's API client for account authentication"""
+        client = getattr(self._local, "acct_client", None)
+        if client is None:
+            client = self._local.acct_client = self._new_api_client(self._get_account_config())
+        return client
+    
+    def _bound_api(self, cache_name: str, api_cls: type, client_getter: Callable[[], ApiClient]) -> Any:
+        """Return this thread's cached api_cls instance for the given client"""
+        apis = getattr(self._local, cache_name, None)
+        if apis is None:
+            apis = {}
+            setattr(self._local, cache_name, apis)
+        if api_cls not in apis:
+            apis[api_cls] = api_cls(client_getter())
+        return apis[api_cls]
     
-    def list_sub_accounts(self):
+    def _sub_api(self, api_cls: type) -> Any:
+        """Return an api_cls (e.g. EmailApi) using sub-account authentication"""
+        return self._bound_api("sub_apis", api_cls, self._sub_api_client)
+    
+    def _acct_api(self, api_cls: type) -> Any:
+        """Return an api_cls (e.g. IPPoolsApi) using account authentication"""
+        return self._bound_api("acct_apis", api_cls, self._acct_api_client)
+    
+    def close(self):
+        """Release every API client and its connection pool"""
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.__exit__(None, None, None)
+        self._local = threading.local()
+    
+    def _cached(self, name: str, fetcher: Callable[..., Any], *args, policy: str = "normal") -> Any:
+        """Return fetcher(*args), reusing the response cached under (name, *args) while fresh"""
+        key = (name,) + args
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is None or entry["stale_at"] <= now:
+            entry = self._cache[key] = {
+                "generated_at": now,
+                "stale_at": now + self._CACHE_TTLS[policy],
+                "payload": fetcher(*args),
+            }
+        return entry["payload"]
+    
+    def _invalidate(self, name: str):
+        """Drop every cached response fetched under name"""
+        for cache in (self._cache, self._etags):
+            for key in [key for key in cache if key[0] == name]:
+                cache.pop(key, None)
+    
+    def _revalidating(self, name: str, fetch_with_http_info: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an SDK *_with_http_info call in a conditional GET
+        
+        The ETag / Last-Modified validators of the previous response for the
+        same (name, *args) are sent back, and on 304 Not Modified its payload
+        is returned without a body being transferred or parsed.
+        """
+        def fetch(*args):
+            key = (name,) + args
+            previous = self._etags.get(key)
+            headers = {}
+            if previous:
+                if previous["etag"]:
+                    headers["If-None-Match"] = previous["etag"]
+                if previous["last_modified"]:
+                    headers["If-Modified-Since"] = previous["last_modified"]
+            try:
+                response = fetch_with_http_info(*args, _headers=headers or None)
+            except ApiException as e:
+                if e.status == 304 and previous:
+                    return previous["payload"]
+                raise
+            
+            response_headers = {k.lower(): v for k, v in (response.headers or {}).items()}
+            etag = response_headers.get("etag")
+            last_modified = response_headers.get("last-modified")
+            if etag or last_modified:
+                self._etags[key] = {"etag": etag, "last_modified": last_modified, "payload": response.data}
+            return response.data
+        return fetch
+    
+    def _report(self, step: str, e: Exception, is_api: bool):
+        """Log the details of a failed step, including the traceback"""
+        if is_api:
+            logger.error("✗ Failed to %s:", step)
+            logger.error("  Status code: %s", e.status)
+            logger.error("  Response body: %s", e.body, exc_info=e)
+        else:
+            logger.error("✗ Unexpected error:", exc_info=e)
+    
+    @step(produces="sub_account_id")
+    def list_sub_accounts(self) -> Optional[int]:
         """Step 1: List all sub-accounts"""
-        print("\n=== Step 1: Listing All Sub-Accounts ===")
+        logger.info("\n=== Step 1: Listing All Sub-Accounts ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                sub_account_api = SubAccountApi(api_client)
-                
-                print("Retrieving all sub-accounts...")
-                sub_accounts = sub_account_api.get_all_sub_accounts()
-                
-                print(f"✓ Retrieved {len(sub_accounts)} sub-account(s)")
-                for sub_account in sub_accounts:
-                    print(f"  - ID: {sub_account.id}")
-                    print(f"    Name: {sub_account.name}")
-                    print(f"    API Key: {sub_account.api_key}")
-                    account_type = "Plus" if (sub_account.type and sub_account.type == 1) else "Regular"
-                    print(f"    Type: {account_type}")
-                    blocked = "Yes" if (sub_account.blocked and sub_account.blocked) else "No"
-                    print(f"    Blocked: {blocked}")
-                    if sub_account.created:
-                        print(f"    Created: {sub_account.created}")
-                    print()
+            sub_account_api = self._acct_api(SubAccountApi)
+            
+            logger.info("Retrieving all sub-accounts...")
+            sub_accounts = self._cached("sub_accounts", sub_account_api.get_all_sub_accounts)
+            
+            logger.info("✓ Retrieved %s sub-account(s)", len(sub_accounts))
+            for sub_account in sub_accounts:
+                logger.info("  - ID: %s", sub_account.id)
+                logger.info("    Name: %s", sub_account.name)
+                logger.info("    API Key: %s", sub_account.api_key)
+                account_type = "Plus" if sub_account.type == 1 else "Regular"
+                logger.info("    Type: %s", account_type)
+                blocked = "Yes" if sub_account.blocked else "No"
+                logger.info("    Blocked: %s", blocked)
+                if sub_account.created:
+                    logger.info("    Created: %s", sub_account.created)
+                logger.info("")
+                
+                # Use first sub-account if none selected
+                if self.created_sub_account_id is None and sub_account.id:
+                    self.created_sub_account_id = sub_account.id
+                    self.created_sub_account_api_key = sub_account.api_key
                     
-                    # Use first sub-account if none selected
-                    if self.created_sub_account_id is None and sub_account.id:
-                        self.created_sub_account_id = sub_account.id
-                        self.created_sub_account_api_key = sub_account.api_key
-                        
         except ApiException as e:
-            print(f"✗ Failed to list sub-accounts:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("list sub-accounts", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("list sub-accounts", e, False)
+        
+        return self.created_sub_account_id
     
     def create_sub_account(self):
         """Step 2: Create a new sub-account"""
-        print("\n=== Step 2: Creating Sub-Account ===")
+        logger.info("\n=== Step 2: Creating Sub-Account ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                sub_account_api = SubAccountApi(api_client)
-                
-                # Create new sub-account request
-                new_sub_account = CreateSubAccountRequest()
-                new_sub_account.name = f"ESP Client - {int(datetime.now().timestamp())}"
-                
-                print(f"Creating sub-account: {new_sub_account.name}")
-                
-                sub_account = sub_account_api.create_sub_account(new_sub_account)
-                
-                self.created_sub_account_id = sub_account.id
-                self.created_sub_account_api_key = sub_account.api_key
-                
-                print("✓ Sub-account created successfully!")
-                print(f"  ID: {self.created_sub_account_id}")
-                print(f"  Name: {sub_account.name}")
-                print(f"  API Key: {self.created_sub_account_api_key}")
-                account_type = "Plus" if (sub_account.type and sub_account.type.value == 1) else "Regular"
-                print(f"  Type: {account_type}")
-                
+            sub_account_api = self._acct_api(SubAccountApi)
+            
+            # Create new sub-account request
+            new_sub_account = CreateSubAccountRequest()
+            new_sub_account.name = f"ESP Client - {self._run_epoch}"
+            
+            logger.info("Creating sub-account: %s", new_sub_account.name)
+            
+            sub_account = sub_account_api.create_sub_account(new_sub_account)
+            self._invalidate("sub_accounts")
+            
+            self.created_sub_account_id = sub_account.id
+            self.created_sub_account_api_key = sub_account.api_key
+            
+            logger.info("✓ Sub-account created successfully!")
+            logger.info("  ID: %s", self.created_sub_account_id)
+            logger.info("  Name: %s", sub_account.name)
+            logger.info("  API Key: %s", self.created_sub_account_api_key)
+            account_kind = sub_account.type
+            account_type = "Plus" if (account_kind and account_kind.value == 1) else "Regular"
+            logger.info("  Type: %s", account_type)
+            
         except ApiException as e:
-            print(f"✗ Failed to create sub-account:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("create sub-account", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("create sub-account", e, False)
     
     def create_webhook(self):
         """Step 3: Create a webhook"""
-        print("\n=== Step 3: Creating Webhook ===")
+        logger.info("\n=== Step 3: Creating Webhook ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                webhook_api = WebhookApi(api_client)
-                
-                # Create new webhook
-                new_webhook = CreateWebhookRequest()
-                new_webhook.url = self.WEBHOOK_URL
-                new_webhook.enabled = True
-                
-                # Configure which events to receive
-                new_webhook.processed = True      # Email processed
-                new_webhook.delivered = True       # Email delivered
-                new_webhook.dropped = True         # Email dropped
-                new_webhook.soft_bounced = True    # Soft bounce
-                new_webhook.hard_bounced = True    # Hard bounce
-                new_webhook.opened = True           # Email opened
-                new_webhook.clicked = True         # Link clicked
-                new_webhook.unsubscribed = True     # Unsubscribed
-                new_webhook.spam = True             # Marked as spam
-                
-                print("Creating webhook...")
-                print(f"  URL: {new_webhook.url}")
-                
-                webhook = webhook_api.create_webhook(new_webhook)
-                self.created_webhook_id = webhook.id
-                
-                print("✓ Webhook created successfully!")
-                print(f"  ID: {self.created_webhook_id}")
-                print(f"  URL: {webhook.url}")
-                print(f"  Enabled: {webhook.enabled}")
-                
+            webhook_api = self._acct_api(WebhookApi)
+            
+            # Create new webhook in one validated construction
+            new_webhook = CreateWebhookRequest(**{**self._WEBHOOK_DEFAULTS, "url": self.WEBHOOK_URL})
+            
+            logger.info("Creating webhook...")
+            logger.info("  URL: %s", new_webhook.url)
+            
+            webhook = webhook_api.create_webhook(new_webhook)
+            self._invalidate("webhooks")
+            self.created_webhook_id = webhook.id
+            
+            logger.info("✓ Webhook created successfully!")
+            logger.info("  ID: %s", self.created_webhook_id)
+            logger.info("  URL: %s", webhook.url)
+            logger.info("  Enabled: %s", webhook.enabled)
+            
         except ApiException as e:
-            print(f"✗ Failed to create webhook:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("create webhook", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("create webhook", e, False)
     
     def list_webhooks(self):
         """Step 4: List all webhooks"""
-        print("\n=== Step 4: Listing All Webhooks ===")
+        logger.info("\n=== Step 4: Listing All Webhooks ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                webhook_api = WebhookApi(api_client)
-                
-                print("Retrieving all webhooks...")
-                webhooks = webhook_api.get_all_webhooks()
+            webhook_api = self._acct_api(WebhookApi)
+            
+            logger.info("Retrieving all webhooks...")
+            webhooks = self._cached("webhooks", webhook_api.get_all_webhooks)
+            
+            logger.info("✓ Retrieved %s webhook(s)", len(webhooks))
+            for webhook in webhooks:
+                logger.info("  - ID: %s", webhook.id)
+                logger.info("    URL: %s", webhook.url)
+                logger.info("    Enabled: %s", webhook.enabled)
+                logger.info("")
                 
-                print(f"✓ Retrieved {len(webhooks)} webhook(s)")
-                for webhook in webhooks:
-                    print(f"  - ID: {webhook.id}")
-                    print(f"    URL: {webhook.url}")
-                    print(f"    Enabled: {webhook.enabled}")
-                    print()
-                    
         except ApiException as e:
-            print(f"✗ Failed to list webhooks:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("list webhooks", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("list webhooks", e, False)
     
     def add_domain(self):
         """Step 3: Add a sending domain"""
-        print("\n=== Step 3: Adding Domain ===")
+        logger.info("\n=== Step 3: Adding Domain ===")
         
         try:
-            config = self._get_sub_account_config()
-            with ApiClient(config) as api_client:
-                domain_api = DomainApi(api_client)
-                
-                # Create domain request
-                domain_request = CreateDomainRequest()
-                domain_request.name = self.TEST_DOMAIN_NAME
-                
-                print(f"Adding domain: {self.TEST_DOMAIN_NAME}")
-                
-                domain = domain_api.subaccount_domain_post(domain_request)
-                self.created_domain_id = str(domain.id) if domain.id else None
-                
-                print("✓ Domain added successfully!")
-                print(f"  ID: {self.created_domain_id}")
-                print(f"  Domain: {domain.name}")
-                verified = "Yes" if (domain.verified and domain.verified) else "No"
-                print(f"  Verified: {verified}")
-                
-                if domain.dkim:
-                    print(f"  DKIM Record: {domain.dkim.text_value}")
-                
-                print("\n⚠️  IMPORTANT: Add the DNS records shown above to your domain's DNS settings to verify the domain.")
-                
+            domain_api = self._sub_api(DomainApi)
+            
+            # Create domain request
+            domain_request = CreateDomainRequest()
+            domain_request.name = self.TEST_DOMAIN_NAME
+            
+            logger.info("Adding domain: %s", self.TEST_DOMAIN_NAME)
+            
+            domain = domain_api.subaccount_domain_post(domain_request)
+            self._invalidate("domains")
+            self.created_domain_id = str(domain.id) if domain.id else None
+            
+            logger.info("✓ Domain added successfully!")
+            logger.info("  ID: %s", self.created_domain_id)
+            logger.info("  Domain: %s", domain.name)
+            verified = "Yes" if domain.verified else "No"
+            logger.info("  Verified: %s", verified)
+            
+            if domain.dkim:
+                logger.info("  DKIM Record: %s", domain.dkim.text_value)
+            
+            logger.info("\n⚠️  IMPORTANT: Add the DNS records shown above to your domain's DNS settings to verify the domain.")
+            
         except ApiException as e:
-            print(f"✗ Failed to add domain:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
+            self._report("add domain", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("add domain", e, False)
     
     def list_domains(self):
         """Step 3: List all domains"""
-        print("\n=== Step 3: Listing All Domains ===")
+        logger.info("\n=== Step 3: Listing All Domains ===")
         
         try:
-            config = self._get_sub_account_config()
-            with ApiClient(config) as api_client:
-                domain_api = DomainApi(api_client)
+            domain_api = self._sub_api(DomainApi)
+            
+            logger.info("Retrieving all domains...")
+            domains = self._cached("domains", domain_api.get_all_domains)
+            
+            logger.info("✓ Retrieved %s domain(s)", len(domains))
+            for domain in domains:
+                logger.info("  - ID: %s", domain.id)
+                logger.info("    Domain: %s", domain.name)
+                verified = "Yes" if domain.verified else "No"
+                logger.info("    Verified: %s", verified)
+                logger.info("")
                 
-                print("Retrieving all domains...")
-                domains = domain_api.get_all_domains()
-                
-                print(f"✓ Retrieved {len(domains)} domain(s)")
-                for domain in domains:
-                    print(f"  - ID: {domain.id}")
-                    print(f"    Domain: {domain.name}")
-                    verified = "Yes" if (domain.verified and domain.verified) else "No"
-                    print(f"    Verified: {verified}")
-                    print()
-                    
         except ApiException as e:
-            print(f"✗ Failed to list domains:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("list domains", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("list domains", e, False)
+    
+    def _message_prototype(self, from_name: str) -> EmailMessageObject:
+        """Return the base message for from_name, with sender and tracking set"""
+        prototype = self._message_prototypes.get(from_name)
+        if prototype is None:
+            from_addr = EmailAddress(email=self.TEST_FROM_EMAIL, name=from_name)
+            prototype = EmailMessageObject(var_from=from_addr, track_opens=True, track_clicks=True)
+            self._message_prototypes[from_name] = prototype
+        return prototype
+    
+    def _build_message(self, from_name: str, to_name: str, subject: str,
+                       html_body: str, text_body: str, headers: dict,
+                       groups: Optional[List[str]] = None,
+                       custom_fields: Optional[dict] = None,
+                       ip_pool: Optional[str] = None) -> EmailMessageObject:
+        """Build an email from TEST_FROM_EMAIL to TEST_TO_EMAIL"""
+        # Start from the sender's prototype so the shared fields are built once
+        email_message = copy.copy(self._message_prototype(from_name))
+        
+        # Set recipient, with optional custom fields
+        recipient = Recipient(email=self.TEST_TO_EMAIL, name=to_name, custom_fields=custom_fields)
+        email_message.to = [recipient]
+        
+        # Set email content
+        email_message.subject = subject
+        email_message.html_body = html_body
+        email_message.text_body = text_body
+        
+        # Use IP pool if available
+        if ip_pool:
+            email_message.ippool = ip_pool
+        
+        # Add group for analytics
+        if groups:
+            email_message.groups = groups
+        
+        # Add custom headers for tracking
+        email_message.headers = headers
+        
+        return email_message
+    
+    def _transactional_message(self, ip_pool: Optional[str] = None) -> EmailMessageObject:
+        """Build the order confirmation email"""
+        return self._build_message(
+            from_name="Your Company",
+            to_name="Customer",
+            subject=_TRANSACTIONAL_SUBJECT,
+            html_body=_TRANSACTIONAL_HTML,
+            text_body=_TRANSACTIONAL_TEXT,
+            headers=_TRANSACTIONAL_HEADERS,
+            custom_fields=_TRANSACTIONAL_CUSTOM_FIELDS,
+            ip_pool=ip_pool,
+        )
+    
+    def _marketing_message(self, ip_pool: Optional[str] = None) -> EmailMessageObject:
+        """Build the promotional offer email"""
+        return self._build_message(
+            from_name="Marketing Team",
+            to_name="Customer 1",
+            subject=_MARKETING_SUBJECT,
+            html_body=_MARKETING_HTML,
+            text_body=_MARKETING_TEXT,
+            headers=_MARKETING_HEADERS,
+            groups=list(_MARKETING_GROUPS),
+            ip_pool=ip_pool,
+        )
     
     def send_transactional_email(self):
         """Step 5: Send a transactional email"""
-        print("\n=== Step 5: Sending Transactional Email ===")
+        logger.info("\n=== Step 5: Sending Transactional Email ===")
         
         try:
-            config = self._get_sub_account_config()
-            with ApiClient(config) as api_client:
-                email_api = EmailApi(api_client)
-                
-                # Create email message
-                email_message = EmailMessageObject()
-                
-                # Set sender
-                from_addr = EmailAddress()
-                from_addr.email = self.TEST_FROM_EMAIL
-                from_addr.name = "Your Company"
-                email_message.var_from = from_addr
-                
-                # Set recipient
-                recipient = Recipient()
-                recipient.email = self.TEST_TO_EMAIL
-                recipient.name = "Customer"
-                
-                # Add custom fields
-                recipient.custom_fields = {
-                    "customer_id": "67890",
-                    "order_value": "99.99"
-                }
-                
-                email_message.to = [recipient]
-                
-                # Set email content
-                email_message.subject = "Order Confirmation - Transactional Email"
-                email_message.html_body = "<h1>Thank you for your order!</h1><p>Your order has been confirmed and will be processed shortly.</p>"
-                email_message.text_body = "Thank you for your order! Your order has been confirmed and will be processed shortly."
+            email_api = self._sub_api(EmailApi)
+            
+            email_message = self._transactional_message(self.created_ip_pool_name)
+            if email_message.ippool:
+                logger.info("  Using IP Pool: %s", email_message.ippool)
+            
+            logger.info("Sending transactional email...")
+            logger.info("  From: %s", self.TEST_FROM_EMAIL)
+            logger.info("  To: %s", self.TEST_TO_EMAIL)
+            logger.info("  Subject: %s", email_message.subject)
+            
+            responses = email_api.send_email(email_message)
+            
+            if responses:
+                response = responses[0]
+                self.sent_message_id = response.message_id
+                
+                logger.info("✓ Transactional email sent successfully!")
+                logger.info("  Message ID: %s", self.sent_message_id)
+                logger.info("  To: %s", response.to)
                 
-                # Enable tracking
-                email_message.track_opens = True
-                email_message.track_clicks = True
-                
-                # Use IP pool if available
-                if self.created_ip_pool_name:
-                    email_message.ippool = self.created_ip_pool_name
-                    print(f"  Using IP Pool: {self.created_ip_pool_name}")
-                
-                # Add custom headers for tracking
-                email_message.headers = {
-                    "X-Order-ID": "12345",
-                    "X-Email-Type": "transactional"
-                }
-                
-                print("Sending transactional email...")
-                print(f"  From: {self.TEST_FROM_EMAIL}")
-                print(f"  To: {self.TEST_TO_EMAIL}")
-                print(f"  Subject: {email_message.subject}")
-                
-                responses = email_api.send_email(email_message)
-                
-                if responses:
-                    response = responses[0]
-                    self.sent_message_id = response.message_id
-                    
-                    print("✓ Transactional email sent successfully!")
-                    print(f"  Message ID: {self.sent_message_id}")
-                    print(f"  To: {response.to}")
-                    
         except ApiException as e:
-            print(f"✗ Failed to send email:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("send email", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("send email", e, False)
     
     def send_marketing_email(self):
         """Step 5: Send a marketing email"""
-        print("\n=== Step 5: Sending Marketing Email ===")
+        logger.info("\n=== Step 5: Sending Marketing Email ===")
         
         try:
-            config = self._get_sub_account_config()
-            with ApiClient(config) as api_client:
-                email_api = EmailApi(api_client)
-                
-                # Create email message
-                email_message = EmailMessageObject()
-                
-                # Set sender
-                from_addr = EmailAddress()
-                from_addr.email = self.TEST_FROM_EMAIL
-                from_addr.name = "Marketing Team"
-                email_message.var_from = from_addr
-                
-                # Set recipient
-                recipient = Recipient()
-                recipient.email = self.TEST_TO_EMAIL
-                recipient.name = "Customer 1"
-                
-                email_message.to = [recipient]
-                
-                # Use IP pool if available
-                if self.created_ip_pool_name:
-                    email_message.ippool = self.created_ip_pool_name
-                
-                # Set email content
-                email_message.subject = "Special Offer - 20% Off Everything!"
-                email_message.html_body = (
-                    "<html><body>"
-                    "<h1>Special Offer!</h1>"
-                    "<p>Get 20% off on all products. Use code: <strong>SAVE20</strong></p>"
-                    "<p><a href=\"https://example.com/shop\">Shop Now</a></p>"
-                    "</body></html>"
-                )
-                email_message.text_body = "Special Offer! Get 20% off on all products. Use code: SAVE20. Visit: https://example.com/shop"
-                
-                # Use IP pool if available
-                if self.created_ip_pool_name:
-                    email_message.ippool = self.created_ip_pool_name
-                
-                # Enable tracking
-                email_message.track_opens = True
-                email_message.track_clicks = True
-                
-                # Add group for analytics
-                email_message.groups = ["marketing", "promotional"]
-                
-                # Add custom headers
-                email_message.headers = {
-                    "X-Email-Type": "marketing",
-                    "X-Campaign-ID": "campaign-001"
-                }
-                
-                print("Sending marketing email...")
-                print(f"  From: {self.TEST_FROM_EMAIL}")
-                print(f"  To: {self.TEST_TO_EMAIL}")
-                print(f"  Subject: {email_message.subject}")
+            email_api = self._sub_api(EmailApi)
+            
+            email_message = self._marketing_message(self.created_ip_pool_name)
+            
+            logger.info("Sending marketing email...")
+            logger.info("  From: %s", self.TEST_FROM_EMAIL)
+            logger.info("  To: %s", self.TEST_TO_EMAIL)
+            logger.info("  Subject: %s", email_message.subject)
+            
+            responses = email_api.send_email(email_message)
+            
+            if responses:
+                response = responses[0]
+                if not self.sent_message_id:
+                    self.sent_message_id = response.message_id
                 
-                responses = email_api.send_email(email_message)
+                logger.info("✓ Marketing email sent successfully!")
+                logger.info("  Message ID: %s", response.message_id)
+                logger.info("  To: %s", response.to)
                 
+        except ApiException as e:
+            self._report("send email", e, True)
+        except Exception as e:
+            self._report("send email", e, False)
+    
+    def _send_email(self, email_message: EmailMessageObject) -> Any:
+        """Send one message with this thread's EmailApi"""
+        return self._sub_api(EmailApi).send_email(email_message)
+    
+    def start_batch(self) -> EmailBatch:
+        """Start an EmailBatch that sends with sub-account authentication"""
+        return EmailBatch(self._send_email)
+    
+    def send_batch(self, messages: List[EmailMessageObject]) -> List[Any]:
+        """Send messages (at most EmailBatch.MAX_SIZE) and return their responses"""
+        batch = self.start_batch()
+        for email_message in messages:
+            batch.add(email_message)
+        return batch.execute()
+    
+    @step(requires=("ip_pool_name",), produces="message_id")
+    def send_emails_batch(self, ip_pool_name: Optional[str] = None) -> Optional[str]:
+        """Step 5: Send the transactional and marketing emails together"""
+        logger.info("\n=== Step 5: Sending Transactional and Marketing Emails ===")
+        
+        ip_pool_name = ip_pool_name or self.created_ip_pool_name
+        try:
+            messages = [
+                ("Transactional", self._transactional_message(ip_pool_name)),
+                ("Marketing", self._marketing_message(ip_pool_name)),
+            ]
+            
+            if ip_pool_name:
+                logger.info("  Using IP Pool: %s", ip_pool_name)
+            for kind, email_message in messages:
+                logger.info("Sending %s email...", kind.lower())
+                logger.info("  From: %s", self.TEST_FROM_EMAIL)
+                logger.info("  To: %s", self.TEST_TO_EMAIL)
+                logger.info("  Subject: %s", email_message.subject)
+            
+            results = self.send_batch([message for _, message in messages])
+            
+            for (kind, _), responses in zip(messages, results):
                 if responses:
                     response = responses[0]
                     if not self.sent_message_id:
                         self.sent_message_id = response.message_id
                     
-                    print("✓ Marketing email sent successfully!")
-                    print(f"  Message ID: {response.message_id}")
-                    print(f"  To: {response.to}")
-                    
+                    logger.info("✓ %s email sent successfully!", kind)
+                    logger.info("  Message ID: %s", response.message_id)
+                    logger.info("  To: %s", response.to)
+                
         except ApiException as e:
-            print(f"✗ Failed to send email:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("send emails", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("send emails", e, False)
+        
+        return self.sent_message_id
+    
+    @staticmethod
+    def _field_lines(obj: Any, fields: Tuple[Tuple[str, str], ...]) -> List[str]:
+        """Format each set field of obj as a '  Label: value' line"""
+        lines = []
+        for attr, label in fields:
+            value = getattr(obj, attr, None)
+            if value is not None:
+                lines.append(f"  {label}: {value}")
+        return lines
+    
+    @staticmethod
+    def _fan_out(fn: Callable[[Any], Any], records: list, max_workers: int = 16) -> List[Any]:
+        """Return fn(record) for each record, in order, running them concurrently
+        
+        fn must return its text rather than log it, since the buffered step
+        output is per thread.
+        """
+        if len(records) < 2:
+            return [fn(record) for record in records]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(records))) as executor:
+            return list(executor.map(fn, records))
     
-    def get_message_details(self):
+    def _pages(self, name: str, fetch: Callable[..., list], page_size: int):
+        """Yield the pages of a limit/offset listing, cached under name
+        
+        The next page is fetched in the background while the caller handles
+        the current one; a short page ends the listing.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            pending = executor.submit(self._cached, name, fetch, page_size, offset)
+            while True:
+                page = pending.result()
+                last = len(page) < page_size
+                if not last:
+                    offset += page_size
+                    pending = executor.submit(self._cached, name, fetch, page_size, offset)
+                yield page
+                if last:
+                    return
+    
+    @step(requires=("message_id",))
+    def get_message_details(self, message_id: Optional[str] = None):
         """Step 6: Retrieve message details"""
-        print("\n=== Step 6: Retrieving Message Details ===")
+        logger.info("\n=== Step 6: Retrieving Message Details ===")
         
-        if not self.sent_message_id:
-            print("✗ No message ID available. Please send an email first.")
+        message_id = message_id or self.sent_message_id
+        if not message_id:
+            logger.info("✗ No message ID available. Please send an email first.")
             return
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                message_api = MessageApi(api_client)
-                
-                print(f"Retrieving message with ID: {self.sent_message_id}")
-                
-                message = message_api.get_message_by_id(self.sent_message_id)
-                
-                print("✓ Message retrieved successfully!")
-                print(f"  Message ID: {message.message_id}")
-                print(f"  Account ID: {message.account_id}")
-                print(f"  Sub-Account ID: {message.sub_account_id}")
-                print(f"  IP ID: {message.ip_id}")
-                print(f"  Public IP: {message.public_ip}")
-                print(f"  Local IP: {message.local_ip}")
-                print(f"  Email Type: {message.email_type}")
-                
-                if message.submitted_at:
-                    print(f"  Submitted At: {message.submitted_at}")
-                
-                if message.var_from:
-                    # Handle Person object (after YAML fix) or dict (backward compatibility)
-                    if message.var_from.email:
-                        from_email = message.var_from.email or 'N/A'
-                        from_name = message.var_from.name or ''
-                        if from_name:
-                            print(f"  From: {from_name} <{from_email}>")
-                        else:
-                            print(f"  From: {from_email}")
-                    else:
-                        print(f"  From: N/A")
-                if message.to:
-                    to_email = message.to.email if hasattr(message.to, 'email') else 'N/A'
-                    print(f"  To: {to_email}")
-                    if hasattr(message.to, 'name') and message.to.name:
-                        print(f"    Name: {message.to.name}")
+            message_api = self._acct_api(MessageApi)
+            
+            logger.info("Retrieving message with ID: %s", message_id)
+            
+            message = message_api.get_message_by_id(message_id)
+            
+            logger.info("✓ Message retrieved successfully!")
+            # Read each field once and log the whole record in one call
+            lines = self._field_lines(message, self._MESSAGE_FIELDS)
+            
+            # Sender and recipient are structured objects
+            sender = message.var_from
+            if sender:
+                if sender.email:
+                    lines.append(f"  From: {sender.name} <{sender.email}>" if sender.name else f"  From: {sender.email}")
+                else:
+                    lines.append("  From: N/A")
+            recipient = message.to
+            if recipient:
+                lines.append(f"  To: {getattr(recipient, 'email', 'N/A')}")
+                to_name = getattr(recipient, 'name', None)
+                if to_name:
+                    lines.append(f"    Name: {to_name}")
+            
+            lines.extend(self._field_lines(message, self._MESSAGE_DELIVERY_FIELDS))
+            logger.info("%s", "\n".join(lines))
                 
-                if message.subject:
-                    print(f"  Subject: {message.subject}")
-                
-                if message.ip_pool:
-                    print(f"  IP Pool: {message.ip_pool}")
-                
-                if message.attempt:
-                    print(f"  Delivery Attempts: {message.attempt}")
-                    
         except ApiException as e:
-            print(f"✗ Failed to get message:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("get message", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("get message", e, False)
     
-    def get_sub_account_stats(self):
+    @step(requires=("sub_account_id",))
+    def get_sub_account_stats(self, sub_account_id: Optional[int] = None):
         """Step 7: Get sub-account statistics"""
-        print("\n=== Step 7: Getting Sub-Account Statistics ===")
+        logger.info("\n=== Step 7: Getting Sub-Account Statistics ===")
         
-        if not self.created_sub_account_id:
-            print("✗ No sub-account ID available. Please create or list sub-accounts first.")
+        sub_account_id = sub_account_id or self.created_sub_account_id
+        if not sub_account_id:
+            logger.info("✗ No sub-account ID available. Please create or list sub-accounts first.")
             return
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                stats_api = StatsApi(api_client)
-                
-                # Get stats for the last 7 days
-                to_date = datetime.now().date()
-                from_date = to_date - timedelta(days=7)
-                
-                print(f"Retrieving stats for sub-account ID: {self.created_sub_account_id}")
-                print(f"  From: {from_date}")
-                print(f"  To: {to_date}")
-                
-                stats = stats_api.account_subaccount_stat_subaccount_id_get(
-                    from_date, to_date, self.created_sub_account_id
-                )
-                
-                print("✓ Stats retrieved successfully!")
-                print(f"  Retrieved {len(stats)} stat record(s)")
-                
-                total_processed = 0
-                total_delivered = 0
-                
-                for stat in stats:
-                    print(f"\n  Date: {stat.var_date}")
-                    if stat.stat:
-                        stat_data = stat.stat
-                        print(f"    Processed: {stat_data.processed or 0}")
-                        print(f"    Delivered: {stat_data.delivered or 0}")
-                        print(f"    Dropped: {stat_data.dropped or 0}")
-                        print(f"    Hard Bounced: {stat_data.hard_bounced or 0}")
-                        print(f"    Soft Bounced: {stat_data.soft_bounced or 0}")
-                        print(f"    Unsubscribed: {stat_data.unsubscribed or 0}")
-                        print(f"    Spam: {stat_data.spam or 0}")
-                        
-                        total_processed += stat_data.processed or 0
-                        total_delivered += stat_data.delivered or 0
-                
-                print(f"\n  Summary (Last 7 days):")
-                print(f"    Total Processed: {total_processed}")
-                print(f"    Total Delivered: {total_delivered}")
-                
+            stats_api = self._acct_api(StatsApi)
+            
+            # Get stats for the last 7 days
+            from_date, to_date = self._stats_window
+            
+            logger.info("Retrieving stats for sub-account ID: %s", sub_account_id)
+            logger.info("  From: %s", from_date)
+            logger.info("  To: %s", to_date)
+            
+            stats = self._cached(
+                "sub_account_stats", stats_api.account_subaccount_stat_subaccount_id_get,
+                from_date, to_date, sub_account_id, policy="short",
+            )
+            
+            logger.info("✓ Stats retrieved successfully!")
+            logger.info("  Retrieved %s stat record(s)", len(stats))
+            
+            # Build the whole report only if it will be shown, and log it in one call
+            if not logger.isEnabledFor(logging.INFO):
+                return
+            chunks = []
+            for stat in stats:
+                chunks.append(f"\n  Date: {stat.var_date}\n")
+                if stat.stat:
+                    chunks.extend(
+                        f"    {label}: {getattr(stat.stat, field) or 0}\n"
+                        for field, label in self._STAT_FIELDS
+                    )
+            
+            stat_data = [stat.stat for stat in stats if stat.stat]
+            totals = {
+                field: sum(getattr(sd, field) or 0 for sd in stat_data)
+                for field, _ in self._STAT_FIELDS
+            }
+            chunks.append("\n  Summary (Last 7 days):\n")
+            chunks.extend(
+                f"    Total {label}: {totals[field]}\n"
+                for field, label in self._STAT_FIELDS
+            )
+            logger.info("%s", "".join(chunks).rstrip("\n"))
+            
         except ApiException as e:
-            print(f"✗ Failed to get stats:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("get stats", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("get stats", e, False)
     
-    def get_aggregate_stats(self):
+    @step(requires=("sub_account_id",))
+    def get_aggregate_stats(self, sub_account_id: Optional[int] = None):
         """Step 7: Get aggregate statistics"""
-        print("\n=== Step 7: Getting Aggregate Statistics ===")
+        logger.info("\n=== Step 7: Getting Aggregate Statistics ===")
         
-        if not self.created_sub_account_id:
-            print("✗ No sub-account ID available. Please create or list sub-accounts first.")
+        sub_account_id = sub_account_id or self.created_sub_account_id
+        if not sub_account_id:
+            logger.info("✗ No sub-account ID available. Please create or list sub-accounts first.")
             return
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                stats_api = StatsApi(api_client)
-                
-                # Get aggregate stats for the last 7 days
-                to_date = datetime.now().date()
-                from_date = to_date - timedelta(days=7)
-                
-                print(f"Retrieving aggregate stats for sub-account ID: {self.created_sub_account_id}")
-                print(f"  From: {from_date}")
-                print(f"  To: {to_date}")
-                
-                aggregate_stat = stats_api.account_subaccount_stat_subaccount_id_aggregate_get(
-                    from_date, to_date, self.created_sub_account_id
-                )
-                
-                print("✓ Aggregate stats retrieved successfully!")
-                print(f"  Processed: {aggregate_stat.processed or 0}")
-                print(f"  Delivered: {aggregate_stat.delivered or 0}")
-                print(f"  Dropped: {aggregate_stat.dropped or 0}")
-                print(f"  Hard Bounced: {aggregate_stat.hard_bounced or 0}")
-                print(f"  Soft Bounced: {aggregate_stat.soft_bounced or 0}")
-                print(f"  Unsubscribed: {aggregate_stat.unsubscribed or 0}")
-                print(f"  Spam: {aggregate_stat.spam or 0}")
-                
+            stats_api = self._acct_api(StatsApi)
+            
+            # Get aggregate stats for the last 7 days
+            from_date, to_date = self._stats_window
+            
+            logger.info("Retrieving aggregate stats for sub-account ID: %s", sub_account_id)
+            logger.info("  From: %s", from_date)
+            logger.info("  To: %s", to_date)
+            
+            aggregate_stat = self._cached(
+                "aggregate_stats", stats_api.account_subaccount_stat_subaccount_id_aggregate_get,
+                from_date, to_date, sub_account_id, policy="short",
+            )
+            
+            logger.info("✓ Aggregate stats retrieved successfully!")
+            logger.info("  Processed: %s", aggregate_stat.processed or 0)
+            logger.info("  Delivered: %s", aggregate_stat.delivered or 0)
+            logger.info("  Dropped: %s", aggregate_stat.dropped or 0)
+            logger.info("  Hard Bounced: %s", aggregate_stat.hard_bounced or 0)
+            logger.info("  Soft Bounced: %s", aggregate_stat.soft_bounced or 0)
+            logger.info("  Unsubscribed: %s", aggregate_stat.unsubscribed or 0)
+            logger.info("  Spam: %s", aggregate_stat.spam or 0)
+            
         except ApiException as e:
-            print(f"✗ Failed to get aggregate stats:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("get aggregate stats", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("get aggregate stats", e, False)
     
-    def list_ips(self):
+    @step(produces="ips")
+    def list_ips(self) -> Optional[list]:
         """Step 4: List all IPs"""
-        print("\n=== Step 4: Listing All IPs ===")
+        logger.info("\n=== Step 4: Listing All IPs ===")
         
+        ips = None
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                ip_api = IPApi(api_client)
+            ip_api = self._acct_api(IPApi)
+            
+            logger.info("Retrieving all IPs...")
+            ips = self._cached("ips", ip_api.get_all_ips)
+            
+            logger.info("✓ Retrieved %s IP(s)", len(ips))
+            for ip in ips:
+                logger.info("  - ID: %s", ip.id)
+                logger.info("    IP Address: %s", ip.public_ip)
+                if ip.reverse_dns_hostname:
+                    logger.info("    Reverse DNS: %s", ip.reverse_dns_hostname)
+                if ip.created:
+                    logger.info("    Created: %s", ip.created)
+                logger.info("")
                 
-                print("Retrieving all IPs...")
-                ips = ip_api.get_all_ips()
-                
-                print(f"✓ Retrieved {len(ips)} IP(s)")
-                for ip in ips:
-                    print(f"  - ID: {ip.id}")
-                    print(f"    IP Address: {ip.public_ip}")
-                    if ip.reverse_dns_hostname:
-                        print(f"    Reverse DNS: {ip.reverse_dns_hostname}")
-                    if ip.created:
-                        print(f"    Created: {ip.created}")
-                    print()
-                    
         except ApiException as e:
-            print(f"✗ Failed to list IPs:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("list IPs", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("list IPs", e, False)
+        
+        return ips
     
-    def create_ip_pool(self):
-        """Step 4: Create an IP Pool"""
-        print("\n=== Step 4: Creating IP Pool ===")
+    @step(requires=("ips",), produces="ip_pool_name")
+    def create_ip_pool(self, ips: Optional[list] = None) -> Optional[str]:
+        """Step 4: Create an IP Pool from ips (all account IPs by default)"""
+        logger.info("\n=== Step 4: Creating IP Pool ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                ip_pools_api = IPPoolsApi(api_client)
-                
-                # First, get available IPs
-                ip_api = IPApi(api_client)
-                ips = ip_api.get_all_ips()
-                
-                if not ips:
-                    print("⚠️  No IPs available. Please allocate IPs first.")
-                    return
-                
-                # Create IP pool request
-                pool_request = IPPoolCreateRequest()
-                pool_name = f"Marketing_Pool_{int(datetime.now().timestamp())}"
-                pool_request.name = pool_name
-                pool_request.routing_strategy = 0  # 0 = RoundRobin, 1 = EmailProviderStrategy
-                pool_request.warmup_interval = 24  # Required by backend: warmup interval in hours (must be > 0)
-                pool_request.overflow_strategy = 0  # 0 = None, 1 = Use overflow pool
-                
-                # Add IPs to the pool (convert IP to EIP)
-                pool_ips = []
-                # Add first available IP (you can add more)
-                if ips:
-                    eip = EIP(public_ip=ips[0].public_ip)
-                    pool_ips.append(eip)
-                pool_request.ips = pool_ips
-                
-                print(f"Creating IP pool: {pool_request.name}")
-                print("  Routing Strategy: Round Robin")
-                print(f"  IPs: {len(pool_ips)}")
-                print(f"  Warmup Interval: {pool_request.warmup_interval} hours")
-                
-                ip_pool = ip_pools_api.create_ip_pool(pool_request)
-                self.created_ip_pool_id = ip_pool.id
-                self.created_ip_pool_name = ip_pool.name  # Store the IP pool name for use in emails
-                
-                print("✓ IP pool created successfully!")
-                print(f"  ID: {self.created_ip_pool_id}")
-                print(f"  Name: {ip_pool.name}")
-                print(f"  Routing Strategy: {ip_pool.routing_strategy}")
-                print(f"  IPs in pool: {len(ip_pool.ips) if ip_pool.ips else 0}")
-                
+            ip_pools_api = self._acct_api(IPPoolsApi)
+            
+            # First, get available IPs (reusing the list from list_ips if it ran)
+            if ips is None:
+                ips = self._cached("ips", self._acct_api(IPApi).get_all_ips)
+            
+            if not ips:
+                logger.info("⚠️  No IPs available. Please allocate IPs first.")
+                return
+            
+            # Add IPs to the pool (convert IP to EIP)
+            # Add first available IP (widen the slice to add more)
+            pool_ips = [EIP(public_ip=ip.public_ip) for ip in ips[:1]]
+            
+            # Create IP pool request
+            pool_request = IPPoolCreateRequest(
+                name=f"Marketing_Pool_{self._run_epoch}",
+                routing_strategy=0,  # 0 = RoundRobin, 1 = EmailProviderStrategy
+                warmup_interval=24,  # Required by backend: warmup interval in hours (must be > 0)
+                overflow_strategy=0,  # 0 = None, 1 = Use overflow pool
+                ips=pool_ips,
+            )
+            
+            logger.info("Creating IP pool: %s", pool_request.name)
+            logger.info("  Routing Strategy: Round Robin")
+            logger.info("  IPs: %s", len(pool_ips))
+            logger.info("  Warmup Interval: %s hours", pool_request.warmup_interval)
+            
+            ip_pool = ip_pools_api.create_ip_pool(pool_request)
+            self._invalidate("ip_pools")
+            self.created_ip_pool_id = ip_pool.id
+            self.created_ip_pool_name = ip_pool.name  # Store the IP pool name for use in emails
+            
+            logger.info("✓ IP pool created successfully!")
+            logger.info("  ID: %s", self.created_ip_pool_id)
+            logger.info("  Name: %s", ip_pool.name)
+            logger.info("  Routing Strategy: %s", ip_pool.routing_strategy)
+            logger.info("  IPs in pool: %s", len(ip_pool.ips) if ip_pool.ips else 0)
+            
         except ApiException as e:
-            print(f"✗ Failed to create IP pool:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("create IP pool", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("create IP pool", e, False)
+        
+        return self.created_ip_pool_name
+    
+    def _describe_pool(self, ip_pool: Any) -> str:
+        """Format one IP pool for the list_ip_pools report"""
+        return (
+            f"  - ID: {ip_pool.id}\n"
+            f"    Name: {ip_pool.name}\n"
+            f"    Routing Strategy: {ip_pool.routing_strategy}\n"
+            f"    IPs in pool: {len(ip_pool.ips) if ip_pool.ips else 0}\n"
+            + "".join(f"      - {ip.public_ip}\n" for ip in ip_pool.ips or ())
+        )
     
     def list_ip_pools(self):
         """Step 4: List all IP Pools"""
-        print("\n=== Step 4: Listing All IP Pools ===")
+        logger.info("\n=== Step 4: Listing All IP Pools ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                ip_pools_api = IPPoolsApi(api_client)
-                
-                print("Retrieving all IP pools...")
-                ip_pools = ip_pools_api.get_all_ip_pools()
+            ip_pools_api = self._acct_api(IPPoolsApi)
+            
+            logger.info("Retrieving all IP pools...")
+            
+            # Show each page as it arrives, building its listing only if it
+            # will be shown, and log it in one call
+            count = 0
+            show = logger.isEnabledFor(logging.INFO)
+            fetch = self._revalidating("ip_pools", ip_pools_api.get_all_ip_pools_with_http_info)
+            for ip_pools in self._pages("ip_pools", fetch, self._IP_POOL_PAGE_SIZE):
+                count += len(ip_pools)
+                if show and ip_pools:
+                    logger.info("%s", "\n".join(self._fan_out(self._describe_pool, ip_pools)))
+            
+            logger.info("✓ Retrieved %s IP pool(s)", count)
                 
-                print(f"✓ Retrieved {len(ip_pools)} IP pool(s)")
-                for ip_pool in ip_pools:
-                    print(f"  - ID: {ip_pool.id}")
-                    print(f"    Name: {ip_pool.name}")
-                    print(f"    Routing Strategy: {ip_pool.routing_strategy}")
-                    print(f"    IPs in pool: {len(ip_pool.ips) if ip_pool.ips else 0}")
-                    if ip_pool.ips:
-                        for ip in ip_pool.ips:
-                            print(f"      - {ip.public_ip}")
-                    print()
-                    
         except ApiException as e:
-            print(f"✗ Failed to list IP pools:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("list IP pools", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("list IP pools", e, False)
+    
+    def _describe_account_stat(self, stat: Any) -> str:
+        """Format one day of account stats for the get_account_stats report"""
+        fields = self._ACCOUNT_STAT_FIELDS if stat.stat else ()
+        return f"\n  Date: {stat.var_date}\n" + "".join(
+            f"    {label}: {getattr(stat.stat, field) or 0}\n" for field, label in fields
+        )
     
     def get_account_stats(self):
         """Step 8: Get account-level statistics"""
-        print("\n=== Step 8: Getting Account-Level Statistics ===")
+        logger.info("\n=== Step 8: Getting Account-Level Statistics ===")
         
         try:
-            config = self._get_account_config()
-            with ApiClient(config) as api_client:
-                stats_a_api = StatsAApi(api_client)
-                
-                # Get stats for the last 7 days
-                to_date = datetime.now().date()
-                from_date = to_date - timedelta(days=7)
-                
-                print("Retrieving account-level stats...")
-                print(f"  From: {from_date}")
-                print(f"  To: {to_date}")
-                
-                account_stats = stats_a_api.get_all_account_stats(from_date, to_date)
-                
-                print("✓ Account stats retrieved successfully!")
-                print(f"  Retrieved {len(account_stats)} stat record(s)")
-                
-                for stat in account_stats:
-                    print(f"\n  Date: {stat.var_date}")
-                    if stat.stat:
-                        stat_data = stat.stat
-                        print(f"    Processed: {stat_data.processed or 0}")
-                        print(f"    Delivered: {stat_data.delivered or 0}")
-                        print(f"    Dropped: {stat_data.dropped or 0}")
-                        print(f"    Hard Bounced: {stat_data.hard_bounced or 0}")
-                        print(f"    Soft Bounced: {stat_data.soft_bounced or 0}")
-                        print(f"    Opens: {stat_data.opened or 0}")
-                        print(f"    Clicks: {stat_data.clicked or 0}")
-                        print(f"    Unsubscribed: {stat_data.unsubscribed or 0}")
-                        print(f"    Spams: {stat_data.spams or 0}")
-                        
+            stats_a_api = self._acct_api(StatsAApi)
+            
+            # Get stats for the last 7 days
+            from_date, to_date = self._stats_window
+            
+            logger.info("Retrieving account-level stats...")
+            logger.info("  From: %s", from_date)
+            logger.info("  To: %s", to_date)
+            
+            # One request per day, fetched concurrently and merged in date order
+            fetch = self._revalidating("account_stats", stats_a_api.get_all_account_stats_with_http_info)
+            
+            def fetch_day(day):
+                return self._cached("account_stats", fetch, day, day, policy="short")
+            
+            days = [from_date + timedelta(days=n) for n in range((to_date - from_date).days + 1)]
+            account_stats = [stat for day_stats in self._fan_out(fetch_day, days) for stat in day_stats]
+            
+            logger.info("✓ Account stats retrieved successfully!")
+            logger.info("  Retrieved %s stat record(s)", len(account_stats))
+            
+            # Build the whole report only if it will be shown, and log it in one call
+            if not logger.isEnabledFor(logging.INFO) or not account_stats:
+                return
+            chunks = self._fan_out(self._describe_account_stat, account_stats)
+            logger.info("%s", "".join(chunks).rstrip("\n"))
+                    
         except ApiException as e:
-            print(f"✗ Failed to get account stats:")
-            print(f"  Status code: {e.status}")
-            print(f"  Response body: {e.body}")
-            import traceback
-            traceback.print_exc()
+            self._report("get account stats", e, True)
         except Exception as e:
-            print(f"✗ Unexpected error:")
-            import traceback
-            traceback.print_exc()
+            self._report("get account stats", e, False)
     
     def run_complete_workflow(self):
         """Run the complete ESP workflow"""
-        print("╔═══════════════════════════════════════════════════════════════╗")
-        print("║   SendPost Python SDK - ESP Example Workflow                  ║")
-        print("╚═══════════════════════════════════════════════════════════════╝")
+        logger.info("%s", _BANNER_START)
+        
+        try:
+            # Step 1: List existing sub-accounts (or create new one)
+            self.list_sub_accounts()
         
-        # Step 1: List existing sub-accounts (or create new one)
-        self.list_sub_accounts()
+            # Step 2: Create webhook for event notifications
+            self.create_webhook()
+            self.list_webhooks()
         
-        # Step 2: Create webhook for event notifications
-        self.create_webhook()
-        self.list_webhooks()
+            # Step 3: Add and verify domain
+            self.add_domain()
+            self.list_domains()
         
-        # Step 3: Add and verify domain
-        self.add_domain()
-        self.list_domains()
+            # Step 4: Manage IPs and IP pools (create before sending emails)
+            self.list_ips()
+            self.create_ip_pool()
+            self.list_ip_pools()
         
-        # Step 4: Manage IPs and IP pools (create before sending emails)
-        self.list_ips()
-        self.create_ip_pool()
-        self.list_ip_pools()
+            # Step 5: Send emails (using the created IP pool)
+            self.send_emails_batch()
         
-        # Step 5: Send emails (using the created IP pool)
-        self.send_transactional_email()
-        self.send_marketing_email()
+            # Step 6: Retrieve message details
+            self.get_message_details()
         
-        # Step 6: Retrieve message details
-        self.get_message_details()
+            # Step 7: Monitor statistics, and
+            # Step 8: Get account-level overview
+            # These only read data, so they are fetched concurrently
+            asyncio.run(self._gather_steps(
+                self.get_sub_account_stats,
+                self.get_aggregate_stats,
+                self.get_account_stats,
+            ))
+        finally:
+            self.close()
         
-        # Step 7: Monitor statistics
-        self.get_sub_account_stats()
-        self.get_aggregate_stats()
-
-        # Step 8: Get account-level overview
-        self.get_account_stats()
+        logger.info("%s", _BANNER_END)
+    
+    async def _gather_steps(self, *steps: Callable[[], None]):
+        """Run blocking workflow steps concurrently on the event loop's executor"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, _step_output.run, step) for step in steps))
+    
+    async def run_parallel_lists(self):
+        """List sub-accounts, webhooks, domains and IPs concurrently"""
+        try:
+            await self._gather_steps(
+                self.list_sub_accounts,
+                self.list_webhooks,
+                self.list_domains,
+                self.list_ips,
+            )
+        finally:
+            self.close()
+    
+    def run_all(self, max_workers: int = 8):
+        """Run the complete ESP workflow, starting each step once its inputs exist"""
+        logger.info("%s", _BANNER_PARALLEL_START)
+        
+        try:
+            pending = [getattr(self, name) for name in self.WORKFLOW_STEPS]
+            artifacts: Dict[str, Any] = {}
+            running: Dict[Future, Callable] = {}
+        
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while pending or running:
+                    # Start every step whose required artifacts have been produced
+                    for method in list(pending):
+                        requires = getattr(method, "requires", ())
+                        if all(name in artifacts for name in requires):
+                            inputs = {name: artifacts[name] for name in requires}
+                            running[executor.submit(_step_output.run, method, **inputs)] = method
+                            pending.remove(method)
+                
+                    if not running:
+                        names = ", ".join(method.__name__ for method in pending)
+                        raise RuntimeError(f"No workflow step produces the inputs of: {names}")
+                
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        method = running.pop(future)
+                        result = future.result()
+                        produces = getattr(method, "produces", None)
+                        if produces:
+                            artifacts[produces] = result
+        finally:
+            self.close()
         
-        print("\n╔═══════════════════════════════════════════════════════════════╗")
-        print("║   Workflow Complete!                                          ║")
-        print("╚═══════════════════════════════════════════════════════════════╝")
+        logger.info("%s", _BANNER_END)
+
+
+def _log_to_stdout() -> logging.handlers.QueueListener:
+    """Send the workflow's output to stdout from a background thread
+    
+    Steps only enqueue their records; the returned (started) listener
+    writes them, and must be stopped to flush what is still queued.
+    """
+    records: queue.Queue = queue.Queue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, stdout_handler)
+    
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
 
 
 def main():
     """Main entry point"""
+    listener = _log_to_stdout()
     example = ESPExample()
     
-    # Check if API keys are set
-    if (example.SUB_ACCOUNT_API_KEY == "YOUR_SUB_ACCOUNT_API_KEY_HERE" or
-        example.ACCOUNT_API_KEY == "YOUR_ACCOUNT_API_KEY_HERE"):
-        print("⚠️  WARNING: Please set your API keys!")
-        print("   Set environment variables:")
-        print("   - SENDPOST_SUB_ACCOUNT_API_KEY")
-        print("   - SENDPOST_ACCOUNT_API_KEY")
-        print("   Or modify the constants in ESPExample.py")
-        print()
-    
-    # Run the complete workflow
-    example.run_complete_workflow()
+    try:
+        # Check if API keys are set
+        if (example.SUB_ACCOUNT_API_KEY == "YOUR_SUB_ACCOUNT_API_KEY_HERE" or
+            example.ACCOUNT_API_KEY == "YOUR_ACCOUNT_API_KEY_HERE"):
+            logger.warning("⚠️  WARNING: Please set your API keys!")
+            logger.warning("   Set environment variables:")
+            logger.warning("   - SENDPOST_SUB_ACCOUNT_API_KEY")
+            logger.warning("   - SENDPOST_ACCOUNT_API_KEY")
+            logger.warning("   Or modify the constants in ESPExample.py")
+            logger.warning("")
+        
+        # Run the complete workflow (pass --parallel to overlap independent steps,
+        # or --lists to only run the read-only listings concurrently)
+        if "--lists" in sys.argv[1:]:
+            asyncio.run(example.run_parallel_lists())
+        elif "--parallel" in sys.argv[1:]:
+            example.run_all()
+        else:
+            example.run_complete_workflow()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
     main()
-